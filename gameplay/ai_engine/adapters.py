@@ -20,10 +20,20 @@ def inject_to_questionruns(stage_run, inject_json: dict) -> int:
     questions = inject_json.get("questions", [])
     time_limit = int(inject_json.get("time_limit_sec", 30))
 
-    created = 0
+    # One SELECT for the keys already present, one bulk INSERT for the
+    # rest, instead of a get_or_create round-trip per question. Existing
+    # rows are never overwritten (audit safety), and seen keys are added
+    # as the batch builds so a payload repeating an id stays a no-op
+    # rather than a duplicate INSERT.
+    seen = set(stage_run.questions.values_list("question_key", flat=True))
+
+    to_create = []
 
     for idx, q in enumerate(questions):
         question_key = q.get("id") or f"{stage_run.stage}-q{idx+1}"
+        if question_key in seen:
+            continue
+        seen.add(question_key)
         prompt = q.get("text", "")
 
         # Normalize choices into your stored format
@@ -39,21 +49,15 @@ def inject_to_questionruns(stage_run, inject_json: dict) -> int:
                 }
             )
 
-        # Idempotent create (avoid duplicates if generate called twice)
-        obj, was_created = QuestionRun.objects.get_or_create(
+        to_create.append(QuestionRun(
             stage_run=stage_run,
             question_key=question_key,
-            defaults={
-                "prompt": prompt,
-                "choices": choices,
-                "order": idx,
-                "status": "pending",
-                "time_limit_seconds": time_limit,
-            },
-        )
-
-        # If it already existed, we don't overwrite (audit safety)
-        if was_created:
-            created += 1
-
-    return created
+            prompt=prompt,
+            choices=choices,
+            order=idx,
+            status="pending",
+            time_limit_seconds=time_limit,
+        ))
+
+    QuestionRun.objects.bulk_create(to_create)
+    return len(to_create)
@@ -0,0 +1,43 @@
+"""
+Hand-rolled dict serializers for the gameplay hot paths.
+
+DRF ModelSerializer spends most of its time building field objects and
+running per-field to_representation; for payloads returned on every state
+poll and answer submit, plain attribute reads into a dict are much cheaper.
+The classes in serializers.py stay around for write validation.
+"""
+
+
+def _iso(dt):
+    return dt.isoformat() if dt else None
+
+
+def serialize_session(session) -> dict:
+    return {
+        "id": session.id,
+        "user": session.user_id,
+        "topic": session.topic,
+        "started_at": _iso(session.started_at),
+        "ended_at": _iso(session.ended_at),
+        "status": session.status,
+        "ended_reason": session.ended_reason,
+        "last_activity_at": _iso(session.last_activity_at),
+        "current_stage_index": session.current_stage_index,
+        "current_question_index": session.current_question_index,
+        "total_score": session.total_score,
+        "wrong_count": session.wrong_count,
+        "wrong_limit": session.wrong_limit,
+        "advice_summary": session.advice_summary,
+    }
+
+
+def serialize_answer(answer) -> dict:
+    return {
+        "id": answer.id,
+        "session": answer.session_id,
+        "question_run": answer.question_run_id,
+        "selected_text": answer.selected_text,
+        "score_delta": answer.score_delta,
+        "is_correct": answer.is_correct,
+        "answered_at": _iso(answer.answered_at),
+    }
@@ -0,0 +1,23 @@
+from django.db import connection
+
+from .models import GameSession
+
+
+def lock_session(session_id: int, **filters) -> GameSession:
+    """
+    Fetches a GameSession with per-session writer serialization, inside
+    the caller's transaction.
+
+    On PostgreSQL this takes pg_advisory_xact_lock(session_id) — a lock
+    table entry released at commit — and then reads the row without
+    FOR UPDATE, so concurrent reads of the same session (current_state,
+    history) never block behind a submit. Other backends fall back to
+    select_for_update, which is what the callers did before.
+
+    Raises GameSession.DoesNotExist like a plain get().
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [session_id])
+        return GameSession.objects.get(id=session_id, **filters)
+    return GameSession.objects.select_for_update().get(id=session_id, **filters)
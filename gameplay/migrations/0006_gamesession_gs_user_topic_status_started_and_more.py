@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-31 14:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gameplay', '0005_playbook_question_option_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gamesession',
+            index=models.Index(fields=['user', 'topic', 'status', '-started_at'], name='gs_user_topic_status_started'),
+        ),
+        migrations.AddIndex(
+            model_name='gamesession',
+            index=models.Index(fields=['user', '-started_at'], name='gs_user_started'),
+        ),
+    ]
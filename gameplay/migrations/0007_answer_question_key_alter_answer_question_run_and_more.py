@@ -0,0 +1,41 @@
+# Generated by Django 5.2.17 on 2026-08-31 14:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_question_key(apps, schema_editor):
+    """Copy question_run.question_key onto legacy rows before the unique
+    constraint lands, so pre-existing answers don't all collide on ''."""
+    Answer = apps.get_model('gameplay', 'Answer')
+    QuestionRun = apps.get_model('gameplay', 'QuestionRun')
+    Answer.objects.filter(question_key='', question_run__isnull=False).update(
+        question_key=models.Subquery(
+            QuestionRun.objects.filter(pk=models.OuterRef('question_run')).values('question_key')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gameplay', '0006_gamesession_gs_user_topic_status_started_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='answer',
+            name='question_key',
+            field=models.CharField(default='', max_length=80),
+        ),
+        migrations.AlterField(
+            model_name='answer',
+            name='question_run',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='answer', to='gameplay.questionrun'),
+        ),
+        migrations.RunPython(backfill_question_key, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='answer',
+            constraint=models.UniqueConstraint(fields=('session', 'question_key'), name='uniq_answer_per_session_q'),
+        ),
+    ]
@@ -57,6 +57,17 @@ class GameSession(models.Model):
 
     factors = models.JSONField(default=dict, blank=True)
 
+    class Meta:
+        # Match the hot lookups: resume (user, topic, status ordered by
+        # started_at) and history (user ordered by started_at).
+        indexes = [
+            models.Index(
+                fields=["user", "topic", "status", "-started_at"],
+                name="gs_user_topic_status_started",
+            ),
+            models.Index(fields=["user", "-started_at"], name="gs_user_started"),
+        ]
+
     def end(self, status: str, reason: str | None = None):
         self.status = status
         self.ended_reason = reason
@@ -125,7 +136,16 @@ class QuestionRun(models.Model):
 
 class Answer(models.Model):
     session = models.ForeignKey(GameSession, on_delete=models.CASCADE, related_name="answers")
-    question_run = models.OneToOneField(QuestionRun, on_delete=models.CASCADE, related_name="answer")
+    # Nullable: JSON-mode sessions score straight from the scenario file and
+    # have no QuestionRun rows.
+    question_run = models.OneToOneField(
+        QuestionRun, on_delete=models.CASCADE, related_name="answer", null=True, blank=True
+    )
+
+    # Denormalized from the question for the per-session uniqueness
+    # constraint below; lets duplicate submits fail on INSERT instead of
+    # needing a pre-check SELECT with a join.
+    question_key = models.CharField(max_length=80, default="")
 
     # Store stable choice id instead of text (text can change)
     selected_choice_id = models.CharField(max_length=80)
@@ -139,8 +159,15 @@ class Answer(models.Model):
 
     answered_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["session", "question_key"], name="uniq_answer_per_session_q"
+            ),
+        ]
+
     def __str__(self):
-        return f"{self.session.id} {self.question_run.question_key} {self.score_delta}"
+        return f"{self.session.id} {self.question_key} {self.score_delta}"
     
 # ---------------------
 # AI Snapshot Models 
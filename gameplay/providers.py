@@ -1,8 +1,22 @@
 import json
+import os
+import sys
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine without it
+    orjson = None
+
+
+def parse_scenario_bytes(raw: bytes) -> dict:
+    """Parses scenario JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 @dataclass
 class CurrentQuestion:
@@ -13,6 +27,18 @@ class CurrentQuestion:
     time_limit_sec: int
     question: Dict[str, Any]  # {id,text,options:[{id/text/score...}]}
 
+    def as_dict(self) -> Dict[str, Any]:
+        # Shallow by design: dataclasses.asdict() recursively deep-copies,
+        # which would clone the cached question payload on every request.
+        return {
+            "topic": self.topic,
+            "stage_index": self.stage_index,
+            "question_index": self.question_index,
+            "stage": self.stage,
+            "time_limit_sec": self.time_limit_sec,
+            "question": self.question,
+        }
+
 
 class BaseScenarioProvider:
     def load(self, topic: str) -> dict:
@@ -25,32 +51,101 @@ class BaseScenarioProvider:
 class JsonScenarioProvider(BaseScenarioProvider):
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
+        # Precomputed str paths; os.stat/open take them without building a
+        # Path object per call.
+        self._data_dir = str(base_dir / "scenarios" / "data")
+        self._paths: Dict[str, str] = {}
+        # topic -> (mtime_ns, parsed dict); scenario files are static at
+        # runtime, so we only re-read when the file on disk changes.
+        self._cache: Dict[str, tuple] = {}
 
     def load(self, topic: str) -> dict:
-        fp = self.base_dir / "scenarios" / "data" / f"{topic}.json"
-        if not fp.exists():
-            raise FileNotFoundError(f"Scenario file not found: {fp}")
-        return json.loads(fp.read_text(encoding="utf-8"))
+        fp = self._paths.get(topic)
+        if fp is None:
+            fp = self._paths[topic] = os.path.join(self._data_dir, f"{topic}.json")
+        try:
+            # EAFP: one stat for the cache key instead of exists() + stat.
+            mtime = os.stat(fp).st_mtime_ns
+            cached = self._cache.get(topic)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            with open(fp, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Scenario file not found: {fp}") from None
+        scn = parse_scenario_bytes(raw)
+        _index_scenario(scn)
+        self._cache[topic] = (mtime, scn)
+        return scn
 
     def get_current_question(self, scn: dict, s_idx: int, q_idx: int) -> Optional[CurrentQuestion]:
-        stages = scn.get("stages", [])
-        if s_idx >= len(stages):
+        idx = scn["_index"]
+        if s_idx >= len(idx.stages):
             return None
-        stage = stages[s_idx]
-        questions = stage.get("questions", [])
-        if q_idx >= len(questions):
+        stage = idx.stages[s_idx]
+        if q_idx >= len(stage.questions):
             return None
 
-        q = questions[q_idx]
         return CurrentQuestion(
-            topic=scn.get("topic", ""),
+            topic=idx.topic,
             stage_index=s_idx,
             question_index=q_idx,
-            stage=stage.get("stage", ""),
-            time_limit_sec=stage.get("time_limit_sec", 30),
-            question={
-                "id": q.get("id"),
-                "text": q.get("question"),
-                "options": q.get("options", []),
-            },
-        )
\ No newline at end of file
+            stage=stage.stage,
+            time_limit_sec=stage.time_limit_sec,
+            question=stage.questions[q_idx],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StageIndex:
+    stage: str
+    time_limit_sec: int
+    questions: tuple  # prebuilt question payload dicts, in order
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioIndex:
+    topic: str
+    stages: tuple  # StageIndex per stage
+    scores_by_qid: Dict[str, Dict[str, int]]
+
+
+def _index_scenario(scn: dict) -> None:
+    """
+    Builds a frozen lookup structure once per parsed scenario so the hot
+    paths do attribute access instead of walking the raw JSON per request:
+
+    - prebuilt question payloads per stage (what get_current_question returns)
+    - option text -> score, keyed by question id (what answer scoring needs)
+
+    Freezing (frozen + slots, tuples for the sequences) makes the cached
+    index safe to share across threads without defensive copies.
+    """
+    stages = []
+    scores_by_qid = {}
+    for stage in scn.get("stages", []):
+        questions = []
+        for q in stage.get("questions", []):
+            questions.append(
+                {
+                    "id": q.get("id"),
+                    "text": q.get("question"),
+                    "options": q.get("options", []),
+                }
+            )
+            scores_by_qid[q.get("id")] = {
+                opt.get("text"): int(opt.get("score", 0))
+                for opt in q.get("options", [])
+            }
+        stages.append(
+            StageIndex(
+                stage=sys.intern(stage.get("stage", "")),
+                time_limit_sec=stage.get("time_limit_sec", 30),
+                questions=tuple(questions),
+            )
+        )
+    scn["_index"] = ScenarioIndex(
+        topic=scn.get("topic", ""),
+        stages=tuple(stages),
+        scores_by_qid=scores_by_qid,
+    )
\ No newline at end of file
@@ -1,11 +1,53 @@
-from .models import GameSession
+from django.db.models import Prefetch
+
+from .models import GameSession, StageRun, QuestionRun
 from .exceptions import NotFound, Forbidden
 
 
 def get_session_for_user(session_id: int, user) -> GameSession:
-    session = GameSession.objects.filter(id=session_id).first()
-    if not session:
+    try:
+        session = GameSession.objects.only(
+            "id",
+            "user",
+            "topic",
+            "status",
+            "current_stage_index",
+            "current_question_index",
+            "total_score",
+            "wrong_count",
+            "wrong_limit",
+        ).get(pk=session_id)
+    except GameSession.DoesNotExist:
         raise NotFound("session not found")
     if session.user_id != user.id:
         raise Forbidden("not your session")
     return session
+
+
+def get_session_with_runs(session_id: int, user_id: int) -> GameSession:
+    """
+    Fetches a session together with its stage runs, question runs and
+    answers in a fixed number of queries, so callers can walk the whole
+    run tree in Python without per-row lookups.
+
+    Scoped by user_id rather than a User instance; serializers only read
+    session.user_id, so no auth_user join or fetch is needed.
+    """
+    try:
+        return (
+            GameSession.objects
+            .prefetch_related(
+                Prefetch(
+                    "stages",
+                    queryset=StageRun.objects.order_by("order").prefetch_related(
+                        Prefetch(
+                            "questions",
+                            queryset=QuestionRun.objects.order_by("order").select_related("answer"),
+                        )
+                    ),
+                )
+            )
+            .get(id=session_id, user_id=user_id)
+        )
+    except GameSession.DoesNotExist:
+        raise NotFound("session not found")
@@ -1,9 +1,9 @@
-from dataclasses import asdict
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from .models import GameSession, Answer
 from .exceptions import NotFound, Conflict, GameplayError
+from .locks import lock_session
 from .providers import BaseScenarioProvider
 
 import random
@@ -38,7 +38,7 @@ class SessionService:
             "status": session.status,
             "total_score": session.total_score,
             "wrong_count": session.wrong_count,
-            "current": asdict(current) if current else None,
+            "current": current.as_dict() if current else None,
         }
 
     def current_state(self, session: GameSession) -> dict:
@@ -50,7 +50,7 @@ class SessionService:
             "status": session.status,
             "total_score": session.total_score,
             "wrong_count": session.wrong_count,
-            "current": asdict(current) if current else None,
+            "current": current.as_dict() if current else None,
         }
 
 
@@ -59,9 +59,14 @@ class AnswerService:
         self.provider = provider
 
     @transaction.atomic
-    def submit_answer(self, session: GameSession, question_id: str, selected_text: str) -> dict:
-        # Lock row to prevent race conditions
-        session = GameSession.objects.select_for_update().get(id=session.id)
+    def submit_answer(self, user, session_id: int, question_id: str, selected_text: str) -> dict:
+        # Per-session advisory lock (row lock on backends without one);
+        # callers pass ids instead of pre-fetching the session and having
+        # it re-queried here.
+        try:
+            session = lock_session(session_id, user=user)
+        except GameSession.DoesNotExist:
+            raise NotFound("session not found")
 
         if session.status != "in_progress":
             raise GameplayError(f"session is {session.status}, cannot answer")
@@ -80,16 +85,8 @@ class AnswerService:
         if q.get("id") != question_id:
             raise GameplayError("question_id does not match current question")
 
-        # conflict check (still keep your unique constraint)
-        if Answer.objects.filter(session=session, question_id=question_id).exists():
-            raise Conflict("already answered")
-
-        # find score
-        score_delta = None
-        for opt in q.get("options", []):
-            if opt.get("text") == selected_text:
-                score_delta = int(opt.get("score", 0))
-                break
+        # find score via the precomputed text -> score table
+        score_delta = scn["_index"].scores_by_qid[question_id].get(selected_text)
         if score_delta is None:
             raise GameplayError("selected_text not found in options")
 
@@ -102,11 +99,10 @@ class AnswerService:
         # advance pointer
         session.current_question_index += 1
 
-        # handle stage boundary
-        stages = scn.get("stages", [])
+        # handle stage boundary via the frozen index
+        stages = scn["_index"].stages
         if session.current_stage_index < len(stages):
-            stage_questions = stages[session.current_stage_index].get("questions", [])
-            if session.current_question_index >= len(stage_questions):
+            if session.current_question_index >= len(stages[session.current_stage_index].questions):
                 session.current_stage_index += 1
                 session.current_question_index = 0
 
@@ -116,17 +112,6 @@ class AnswerService:
             session.ended_at = timezone.now()
             session.ended_reason = "too_many_wrongs"
 
-        session.save()
-
-        Answer.objects.create(
-            session=session,
-            stage=current.stage,
-            question_id=question_id,
-            selected_text=selected_text,
-            score_delta=score_delta,
-            is_correct=(score_delta > 0),
-        )
-
         next_current = self.provider.get_current_question(
             scn, session.current_stage_index, session.current_question_index
         )
@@ -136,7 +121,35 @@ class AnswerService:
             session.status = "completed"
             session.ended_at = timezone.now()
             session.ended_reason = "finished"
-            session.save(update_fields=["status", "ended_at", "ended_reason"])
+
+        # single UPDATE after every state transition has been applied,
+        # listing only the mutated columns (last_activity_at is auto_now
+        # and must be named to be refreshed with update_fields)
+        session.save(
+            update_fields=[
+                "total_score",
+                "wrong_count",
+                "current_stage_index",
+                "current_question_index",
+                "status",
+                "ended_reason",
+                "ended_at",
+                "last_activity_at",
+            ]
+        )
+
+        # Duplicates trip the (session, question_key) constraint on INSERT,
+        # replacing the old pre-check SELECT.
+        try:
+            Answer.objects.create(
+                session=session,
+                question_key=question_id,
+                selected_text=selected_text,
+                score_delta=score_delta,
+                is_correct=(score_delta > 0),
+            )
+        except IntegrityError:
+            raise Conflict("already answered")
 
         return {
             "session_id": session.id,
@@ -144,7 +157,7 @@ class AnswerService:
             "ended_reason": session.ended_reason,
             "total_score": session.total_score,
             "wrong_count": session.wrong_count,
-            "next": next_current.__dict__ if next_current else None,
+            "next": next_current.as_dict() if next_current else None,
             "awarded_points": score_delta,
         }
 # ============================
@@ -182,16 +195,17 @@ def start_ai_session(user, topic: str, difficulty: int):
 
     from gameplay.ai_engine.schemas import STAGE_ORDER
 
-    # Pre-create ALL stages
-    for i, stage in enumerate(STAGE_ORDER):
-        StageRun.objects.create(
+    # Pre-create ALL stages in one INSERT
+    StageRun.objects.bulk_create(
+        StageRun(
             session=session,
             stage=stage,
             order=i,
             status="active" if i == 0 else "locked",
             stage_score=0,
         )
-
+        for i, stage in enumerate(STAGE_ORDER)
+    )
 
     return session, scenario_snapshot
 
@@ -235,20 +249,19 @@ def generate_ai_stage(session: GameSession, stage_name: str):
         "post_incident": 4,
     }
 
-    stage_run, _ = StageRun.objects.get_or_create(
+    # Single upsert: creates the run active, or flips an existing one to
+    # active, instead of get_or_create followed by a separate status save.
+    stage_run, _ = StageRun.objects.update_or_create(
         session=session,
         stage=stage_name,
-        defaults={
+        defaults={"status": "active"},
+        create_defaults={
             "order": order_map[stage_name],
             "status": "active",
             "stage_score": 0,
         },
     )
 
-    if stage_run.status != "active":
-        stage_run.status = "active"
-        stage_run.save(update_fields=["status"])
-
     # 3) Backfill QuestionRuns if missing
     from gameplay.ai_engine.adapters import inject_to_questionruns
     if not stage_run.questions.exists():
@@ -296,7 +309,7 @@ def pick_playbook(*, difficulty: str, playbook_slug: str, version: int = 1) -> P
 # Static Session Builder
 #================================
 from gameplay.models import GameSession, StageRun, QuestionRun, Playbook, Question
-from django.db import transaction
+from django.db import IntegrityError, transaction
 import random
 
 
@@ -323,18 +336,26 @@ def start_static_session(user, difficulty: str, topic: str, questions_per_stage:
     # 2️⃣ Get playbook
     playbook = Playbook.objects.get(slug=topic, difficulty=difficulty)
 
-    # 3️⃣ Create StageRuns
-    stage_runs = {}
-
-    for order, phase in enumerate(STAGE_SLUG_MAP.keys()):
-        stage_runs[phase] = StageRun.objects.create(
-            session=session,
-            stage=STAGE_SLUG_MAP[phase],
-            order=order,
-            status="active" if order == 0 else "locked",
+    # 3️⃣ Create StageRuns in one INSERT (bulk_create fills in the pks)
+    stage_runs = dict(
+        zip(
+            STAGE_SLUG_MAP.keys(),
+            StageRun.objects.bulk_create(
+                StageRun(
+                    session=session,
+                    stage=STAGE_SLUG_MAP[phase],
+                    order=order,
+                    status="active" if order == 0 else "locked",
+                )
+                for order, phase in enumerate(STAGE_SLUG_MAP.keys())
+            ),
         )
+    )
+
+    # 4️⃣ Pick and snapshot questions; rows are collected across all
+    # stages and written with a single bulk_create at the end.
+    question_runs = []
 
-    # 4️⃣ Pick and snapshot questions
     for phase, stage_run in stage_runs.items():
 
         questions = list(
@@ -350,7 +371,7 @@ def start_static_session(user, difficulty: str, topic: str, questions_per_stage:
 
         for q_order, q in enumerate(selected):
 
-            QuestionRun.objects.create(
+            question_runs.append(QuestionRun(
                 stage_run=stage_run,
                 question_key=q.external_id,
                 prompt=q.prompt,
@@ -364,6 +385,8 @@ def start_static_session(user, difficulty: str, topic: str, questions_per_stage:
                     for opt in q.options.all()
                 ],
                 order=q_order,
-            )
+            ))
+
+    QuestionRun.objects.bulk_create(question_runs)
 
     return session
\ No newline at end of file
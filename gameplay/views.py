@@ -1,24 +1,34 @@
-import json
+import os
+import sys
+import uuid
+from functools import lru_cache
 from pathlib import Path
 
-from django.db import transaction
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 
 from .models import GameSession, Answer, StageRun, QuestionRun
 from .serializers import (
-    GameSessionSerializer,
-    AnswerSerializer,
     StartSessionSerializer,
     GenerateStageSerializer,
 )
+from .fast_serializers import serialize_session, serialize_answer
+from .providers import parse_scenario_bytes
 
+from .selectors import get_session_with_runs
+from .locks import lock_session
+from .exceptions import NotFound
 from .services import start_ai_session, generate_ai_stage, generate_ai_debrief
 
 from rest_framework.decorators import api_view
@@ -66,61 +76,131 @@ def session_start(request):
 # Scenario helpers (STATIC JSON)
 # -----------------------------
 BASE_DIR = Path(__file__).resolve().parent.parent  # backend/
+_DATA_DIR = str(BASE_DIR / "scenarios" / "data")
+
+# topic -> (mtime_ns, parsed dict). Scenario JSON is static content, so the
+# parsed dict is cached per topic and only re-read when the file changes.
+_SCENARIO_CACHE: dict = {}
+
+
+@lru_cache(maxsize=64)
+def _scenario_path(topic: str) -> str:
+    # Plain strings: no per-request Path construction, and os.stat/open
+    # take them directly.
+    return os.path.join(_DATA_DIR, f"{topic}.json")
 
 
 def load_scenario(topic: str) -> dict:
-    scenario_path = BASE_DIR / "scenarios" / "data" / f"{topic}.json"
-    if not scenario_path.exists():
-        raise FileNotFoundError(f"Scenario file not found: {scenario_path}")
-    return json.loads(scenario_path.read_text(encoding="utf-8"))
+    scenario_path = _scenario_path(topic)
+    try:
+        # EAFP: one stat for the cache key instead of exists() + stat.
+        mtime = os.stat(scenario_path).st_mtime_ns
+        cached = _SCENARIO_CACHE.get(topic)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(scenario_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Scenario file not found: {scenario_path}") from None
+    scn = parse_scenario_bytes(raw)
+    stages = scn.get("stages", [])
+    # Per-stage (name, time_limit) tuples, interned once at load so the
+    # per-request payload builder does tuple indexing instead of dict gets.
+    scn["_stage_meta"] = [
+        (sys.intern(s.get("stage") or ""), s.get("time_limit_sec", 30))
+        for s in stages
+    ]
+    # Question counts per stage, so pointer advancement and bounds checks
+    # are pure integer ops instead of walking the raw JSON tree.
+    scn["_stage_lens"] = tuple(len(s.get("questions", [])) for s in stages)
+    _SCENARIO_CACHE[topic] = (mtime, scn)
+    return scn
 
 
 def get_stage_and_question(scn: dict, stage_index: int, question_index: int):
     """
     Returns (stage_obj, question_obj) or (None, None) if out of range.
     """
-    stages = scn.get("stages", [])
-    if stage_index < 0 or stage_index >= len(stages):
+    stage_lens = scn["_stage_lens"]
+    if stage_index < 0 or stage_index >= len(stage_lens):
         return None, None
 
-    stage_obj = stages[stage_index]
-    questions = stage_obj.get("questions", [])
-    if question_index < 0 or question_index >= len(questions):
+    stage_obj = scn["stages"][stage_index]
+    if question_index < 0 or question_index >= stage_lens[stage_index]:
         return stage_obj, None
 
-    return stage_obj, questions[question_index]
+    return stage_obj, stage_obj["questions"][question_index]
 
 
-def build_next_payload(stage_obj: dict, question_obj: dict) -> dict:
+def build_next_payload(scn: dict, stage_index: int, question_obj: dict) -> dict:
+    stage_name, time_limit = scn["_stage_meta"][stage_index]
     return {
-        "stage": stage_obj.get("stage"),
-        "time_limit_sec": stage_obj.get("time_limit_sec", 30),
+        "stage": stage_name,
+        "time_limit_sec": time_limit,
         "question": question_obj,
     }
 
 
-def advance_pointer(scn: dict, session: GameSession) -> None:
+def score_choice(choices, selected_choice_id, score_key: str):
+    """
+    Resolves a selected choice id against a question's stored choices.
+
+    Returns (score_delta, selected_text), or (None, "") when the id does
+    not match. score_key names the stored score field ("delta_score" for
+    static snapshots, "score" for AI injects). Choice lists hold a
+    handful of options, so one pass with the wanted id normalized once is
+    already optimal — no index or array machinery pays for itself here.
+    """
+    wanted = str(selected_choice_id)
+    for opt in choices:
+        if str(opt.get("id")) == wanted:
+            return int(opt.get(score_key, 0)), opt.get("text", "")
+    return None, ""
+
+
+def advance_pointer(stage_lens: tuple, session: GameSession) -> None:
     """
     Advances session.current_question_index/current_stage_index to the next question.
     Does NOT save session.
+
+    Takes the precomputed ``scn["_stage_lens"]`` tuple rather than the
+    scenario dict, so the hot path is integer compares on a small tuple
+    with no dict lookups.
     """
-    stages = scn.get("stages", [])
     session.current_question_index += 1
 
-    if 0 <= session.current_stage_index < len(stages):
-        stage_questions = stages[session.current_stage_index].get("questions", [])
-        if session.current_question_index >= len(stage_questions):
-            session.current_stage_index += 1
-            session.current_question_index = 0
+    si = session.current_stage_index
+    if 0 <= si < len(stage_lens) and session.current_question_index >= stage_lens[si]:
+        session.current_stage_index += 1
+        session.current_question_index = 0
+
+
+# (user_id, topic) -> active session id. This is the denormalized
+# "active session" pointer: written on create/resume, cleared on every
+# terminal transition, kept without a TTL so mid-game resumes never fall
+# back to the filtered/ordered lookup. A cold cache (process restart)
+# degrades to the query path, never to wrong data.
+_ACTIVE_SESSION_TTL = None
+
+
+def _active_session_key(user_id: int, topic: str) -> str:
+    return f"gp:act:{user_id}:{topic}"
+
+
+def _answer_idempotency_key(user_id: int, session_id: int, client_answer_id) -> str:
+    # Scoped by user and session so a replayed client id can only ever
+    # surface a payload to the submitter it belongs to.
+    return f"gp:ans:{user_id}:{session_id}:{client_answer_id}"
 
 
 # -----------------------------
 # Endpoints (STATIC JSON)
 # -----------------------------
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def health(request):
-    return Response({"ok": True, "service": "gameplay"})
+@require_GET
+async def health(request):
+    # Async plain Django view: no auth, constant payload, no I/O, so
+    # under ASGI it costs neither a worker thread nor DRF's wrapping.
+    return JsonResponse({"ok": True, "service": "gameplay"})
 
 
 @api_view(["POST"])
@@ -135,21 +215,30 @@ def start_or_resume(request):
         return Response({"detail": "topic is required"}, status=status.HTTP_400_BAD_REQUEST)
 
     created = False
+    cache_key = _active_session_key(request.user.id, topic)
 
-    session = (
-        GameSession.objects.filter(user=request.user, topic=topic, status="in_progress")
-        .order_by("-started_at")
-        .first()
-    )
+    session = None
+    cached_id = cache.get(cache_key)
+    if cached_id:
+        session = GameSession.objects.filter(pk=cached_id, status="in_progress").first()
+
+    if not session:
+        session = (
+            GameSession.objects.filter(user_id=request.user.id, topic=topic, status="in_progress")
+            .order_by("-started_at")
+            .first()
+        )
 
     if not session:
         session = GameSession.objects.create(
-            user=request.user,
+            user_id=request.user.id,
             topic=topic,
             status="in_progress",
         )
         created = True
 
+    cache.set(cache_key, session.id, _ACTIVE_SESSION_TTL)
+
     try:
         scn = load_scenario(topic)
     except FileNotFoundError as e:
@@ -161,8 +250,10 @@ def start_or_resume(request):
 
     payload = {
         "message": "started" if created else "resumed",
-        "session": GameSessionSerializer(session).data,
-        "next": build_next_payload(stage_obj, question_obj) if (stage_obj and question_obj) else None,
+        "session": serialize_session(session),
+        "next": build_next_payload(scn, session.current_stage_index, question_obj)
+        if (stage_obj and question_obj)
+        else None,
     }
     return Response(payload, status=status.HTTP_200_OK)
 
@@ -170,36 +261,37 @@ def start_or_resume(request):
 @permission_classes([IsAuthenticated])
 def current_state(request, session_id: int):
 
-    session = GameSession.objects.filter(id=session_id, user=request.user).first()
-    if not session:
+    try:
+        session = get_session_with_runs(session_id, request.user.id)
+    except NotFound:
         return Response({"detail": "session not found"}, status=404)
 
     if session.status != "in_progress":
         return Response({
-            "session": GameSessionSerializer(session).data,
+            "session": serialize_session(session),
             "next": None
         })
 
-    # Get active stage
-    stage_run = session.stages.filter(status="active").order_by("order").first()
+    # Stages/questions are prefetched in order; walk them in Python instead
+    # of issuing per-relation queries.
+    stage_run = next((s for s in session.stages.all() if s.status == "active"), None)
 
     if not stage_run:
         return Response({
-            "session": GameSessionSerializer(session).data,
+            "session": serialize_session(session),
             "next": None
         })
 
-    # Get next pending question
-    qrun = stage_run.questions.filter(status="pending").order_by("order").first()
+    qrun = next((q for q in stage_run.questions.all() if q.status == "pending"), None)
 
     if not qrun:
         return Response({
-            "session": GameSessionSerializer(session).data,
+            "session": serialize_session(session),
             "next": None
         })
 
     return Response({
-        "session": GameSessionSerializer(session).data,
+        "session": serialize_session(session),
         "next": {
             "stage": stage_run.stage,
             "time_limit_sec": qrun.time_limit_seconds,
@@ -218,6 +310,7 @@ def submit_answer(request, session_id: int):
 
     question_id = request.data.get("question_id")
     selected_choice_id = request.data.get("selected_choice_id")
+    client_answer_id = request.data.get("client_answer_id")
 
     if not question_id or not selected_choice_id:
         return Response(
@@ -225,10 +318,29 @@ def submit_answer(request, session_id: int):
             status=400,
         )
 
-    session = GameSession.objects.filter(id=session_id, user=request.user).first()
-    if not session:
+    # Reject malformed ids up front; the UUIDField on Answer would raise
+    # on INSERT and turn this into a 500 otherwise.
+    if client_answer_id:
+        try:
+            client_answer_id = str(uuid.UUID(str(client_answer_id)))
+        except ValueError:
+            return Response({"detail": "client_answer_id must be a UUID"}, status=400)
+
+    try:
+        session = GameSession.objects.get(id=session_id, user_id=request.user.id)
+    except GameSession.DoesNotExist:
         return Response({"detail": "session not found"}, status=404)
 
+    # Idempotency: a retried submit with the same client_answer_id gets the
+    # stored response back before any scenario or DB work happens. Checked
+    # only after the ownership lookup, and keyed per user and session.
+    if client_answer_id:
+        cached_payload = cache.get(
+            _answer_idempotency_key(request.user.id, session.id, client_answer_id)
+        )
+        if cached_payload is not None:
+            return Response(cached_payload, status=201)
+
     if session.status != "in_progress":
         return Response({"detail": f"session is {session.status}"}, status=400)
 
@@ -243,14 +355,7 @@ def submit_answer(request, session_id: int):
         return Response({"detail": "question not found or already answered"}, status=404)
 
     # Find selected option
-    score_delta = None
-    selected_text = ""
-
-    for opt in qrun.choices:
-        if str(opt.get("id")) == str(selected_choice_id):
-            score_delta = int(opt.get("delta_score", 0))
-            selected_text = opt.get("text", "")
-            break
+    score_delta, selected_text = score_choice(qrun.choices, selected_choice_id, "delta_score")
 
     if score_delta is None:
         return Response({"detail": "selected choice not found"}, status=400)
@@ -258,26 +363,37 @@ def submit_answer(request, session_id: int):
     is_correct = score_delta > 0
 
     with transaction.atomic():
+        # Optimistic concurrency: claiming the question with a conditional
+        # UPDATE is the whole guard. A concurrent duplicate finds zero
+        # pending rows and stops here — no select_for_update re-fetches,
+        # so other sessions never serialize on the GameSession table.
+        claimed = QuestionRun.objects.filter(id=qrun.id, status="pending").update(
+            status="answered"
+        )
+        if not claimed:
+            return Response({"detail": "already answered"}, status=409)
 
-        session = GameSession.objects.select_for_update().get(id=session.id)
-        qrun = QuestionRun.objects.select_for_update().get(id=qrun.id)
+        qrun.status = "answered"
         stage_run = qrun.stage_run
 
-        # Mark question answered
-        qrun.status = "answered"
-        qrun.save(update_fields=["status"])
-
-        # Create answer record
-        ans = Answer.objects.create(
-            session=session,
-            question_run=qrun,
-            selected_choice_id=str(selected_choice_id),
-            selected_text=selected_text,
-            score_delta=score_delta,
-            is_correct=is_correct,
-        )
+        # Create answer record; the OneToOne on question_run backstops the
+        # claim above.
+        try:
+            ans = Answer.objects.create(
+                session=session,
+                question_run=qrun,
+                question_key=qrun.question_key,
+                selected_choice_id=str(selected_choice_id),
+                selected_text=selected_text,
+                score_delta=score_delta,
+                is_correct=is_correct,
+                client_answer_id=client_answer_id or None,
+            )
+        except IntegrityError:
+            return Response({"detail": "already answered"}, status=409)
 
-        # Update scores
+        # In-memory bookkeeping for the response payload; the database gets
+        # the same deltas via F() below.
         session.total_score += score_delta
         stage_run.stage_score += score_delta
 
@@ -287,7 +403,6 @@ def submit_answer(request, session_id: int):
         # Advance stage if no pending questions left
         if not stage_run.questions.filter(status="pending").exists():
             stage_run.status = "done"
-            stage_run.save(update_fields=["status"])
 
             next_stage = (
                 session.stages
@@ -310,23 +425,48 @@ def submit_answer(request, session_id: int):
             session.ended_reason = "too_many_wrongs"
             session.ended_at = timezone.now()
 
-        stage_run.save(update_fields=["stage_score"])
-        session.save()
+        StageRun.objects.filter(pk=stage_run.id).update(
+            stage_score=F("stage_score") + score_delta,
+            status=stage_run.status,
+        )
+        # Guarded by status so a concurrent quit/fail wins; zero rows means
+        # the session left in_progress under us and this submit rolls back.
+        updated = GameSession.objects.filter(
+            pk=session.id, status="in_progress"
+        ).update(
+            total_score=F("total_score") + score_delta,
+            wrong_count=F("wrong_count") + (0 if is_correct else 1),
+            status=session.status,
+            ended_reason=session.ended_reason,
+            ended_at=session.ended_at,
+            last_activity_at=timezone.now(),
+        )
+        if not updated:
+            transaction.set_rollback(True)
+            return Response({"detail": "session is no longer in progress"}, status=409)
 
-    return Response(
-        {
-            "answer": AnswerSerializer(ans).data,
-            "session": GameSessionSerializer(session).data,
-        },
-        status=201,
-    )
+    if session.status != "in_progress":
+        cache.delete(_active_session_key(session.user_id, session.topic))
+
+    payload = {
+        "answer": serialize_answer(ans),
+        "session": serialize_session(session),
+    }
+    if client_answer_id:
+        cache.set(
+            _answer_idempotency_key(request.user.id, session.id, client_answer_id),
+            payload,
+            600,
+        )
+    return Response(payload, status=201)
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def quit_session(request, session_id: int):
-    session = GameSession.objects.filter(id=session_id, user=request.user).first()
-    if not session:
+    try:
+        session = GameSession.objects.get(id=session_id, user_id=request.user.id)
+    except GameSession.DoesNotExist:
         return Response({"detail": "session not found"}, status=status.HTTP_404_NOT_FOUND)
 
     if session.status == "in_progress":
@@ -334,15 +474,48 @@ def quit_session(request, session_id: int):
         session.ended_reason = "user_quit"
         session.ended_at = timezone.now()
         session.save(update_fields=["status", "ended_reason", "ended_at"])
+        cache.delete(_active_session_key(session.user_id, session.topic))
 
-    return Response({"session": GameSessionSerializer(session).data})
+    return Response({"session": serialize_session(session)})
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def history(request):
-    qs = GameSession.objects.filter(user=request.user).order_by("-started_at")[:50]
-    return Response({"sessions": GameSessionSerializer(qs, many=True).data})
+    # Bounded pagination so one request never drags more than 100 rows.
+    try:
+        limit = int(request.query_params.get("limit", 50))
+        offset = int(request.query_params.get("offset", 0))
+    except ValueError:
+        return Response({"detail": "limit and offset must be integers"}, status=400)
+    limit = max(1, min(limit, 100))
+    offset = max(0, offset)
+
+    # values() skips both model instantiation and per-row serializer work;
+    # the key set matches what GameSessionSerializer used to emit.
+    rows = list(
+        GameSession.objects.filter(user_id=request.user.id)
+        .order_by("-started_at")
+        .values(
+            "id",
+            "user",
+            "topic",
+            "started_at",
+            "ended_at",
+            "status",
+            "ended_reason",
+            "last_activity_at",
+            "current_stage_index",
+            "current_question_index",
+            "total_score",
+            "wrong_count",
+            "wrong_limit",
+            "advice_summary",
+        )[offset : offset + limit]
+    )
+    # JsonResponse (DjangoJSONEncoder handles the datetimes) skips DRF's
+    # renderer negotiation; @api_view stays for JWT auth.
+    return JsonResponse({"sessions": rows})
 
 # -----------------------------
 # Endpoints (AI Engine)
@@ -538,17 +711,8 @@ class AIAnswerSubmitView(APIView):
         if not qrun:
             return Response({"detail": "question not found"}, status=404)
 
-        if hasattr(qrun, "answer"):
-            return Response({"detail": "already answered"}, status=409)
-
         # Score lookup from stored snapshot choices
-        score_delta = None
-        selected_text = ""
-        for opt in (qrun.choices or []):
-            if str(opt.get("id")) == str(selected_choice_id):
-                score_delta = int(opt.get("score", 0))
-                selected_text = opt.get("text", "")
-                break
+        score_delta, selected_text = score_choice(qrun.choices or [], selected_choice_id, "score")
 
         if score_delta is None:
             return Response({"detail": "selected choice not found"}, status=400)
@@ -556,28 +720,36 @@ class AIAnswerSubmitView(APIView):
         is_correct = score_delta > 0
 
         with transaction.atomic():
-            # lock rows
-            session = GameSession.objects.select_for_update().get(id=session.id)
-            qrun = QuestionRun.objects.select_for_update().select_related("stage_run").get(id=qrun.id)
+            # Every writer for this session takes the session lock first,
+            # so the question row needs no lock of its own.
+            session = lock_session(session.id)
+            qrun = QuestionRun.objects.select_related("stage_run").get(id=qrun.id)
             stage_run = qrun.stage_run
 
             # Mark question answered
             qrun.status = "answered"
             qrun.save(update_fields=["status"])
 
-            # Create answer record
-            ans = Answer.objects.create(
-                session=session,
-                question_run=qrun,
-                selected_choice_id=str(selected_choice_id),
-                selected_text=selected_text,
-                score_delta=score_delta,
-                is_correct=is_correct,
-            )
+            # Create answer record; duplicates trip the OneToOne
+            # constraint on question_run rather than a pre-check query.
+            try:
+                ans = Answer.objects.create(
+                    session=session,
+                    question_run=qrun,
+                    question_key=qrun.question_key,
+                    selected_choice_id=str(selected_choice_id),
+                    selected_text=selected_text,
+                    score_delta=score_delta,
+                    is_correct=is_correct,
+                )
+            except IntegrityError:
+                return Response({"detail": "already answered"}, status=409)
 
-            # Update scores
+            # Update scores; stage_run writes are coalesced into one save
+            # at the end of the transaction.
             session.total_score += score_delta
             stage_run.stage_score += score_delta
+            stage_run_fields = {"stage_score"}
 
             if not is_correct:
                 session.wrong_count += 1
@@ -592,13 +764,12 @@ class AIAnswerSubmitView(APIView):
             elif score_delta <= -10:
                 session.pressure_level += 20
 
-
-        # WAR MODE: harsher penalties under pressure
-        if session.pressure_level > 50:
-            if score_delta == -5:
-                score_delta = -8
-            elif score_delta <= -10:
-                score_delta = -15
+            # WAR MODE: harsher penalties under pressure
+            if session.pressure_level > 50:
+                if score_delta == -5:
+                    score_delta = -8
+                elif score_delta <= -10:
+                    score_delta = -15
 
             # clamp 0–100
             session.pressure_level = min(session.pressure_level, 100)
@@ -615,17 +786,6 @@ class AIAnswerSubmitView(APIView):
                 session.ended_reason = "too_many_wrongs"
                 session.ended_at = timezone.now()
 
-            # save stage + session
-            stage_run.save(update_fields=["stage_score"])
-            session.save(update_fields=[
-                "total_score",
-                "wrong_count",
-                "pressure_level",
-                "status",
-                "ended_reason",
-                "ended_at",
-            ])
-
             # ----------------------
             # Auto-progression
             # ----------------------
@@ -634,7 +794,7 @@ class AIAnswerSubmitView(APIView):
                 # If no pending questions remain in this stage
                 if not stage_run.questions.filter(status="pending").exists():
                     stage_run.status = "done"
-                    stage_run.save(update_fields=["status"])
+                    stage_run_fields.add("status")
 
                     # Activate next locked stage
                     next_stage = (
@@ -652,25 +812,33 @@ class AIAnswerSubmitView(APIView):
                         session.status = "completed"
                         session.ended_reason = "finished"
                         session.ended_at = timezone.now()
-                        session.save(update_fields=["status", "ended_reason", "ended_at"])
-
-           
-
-            # If failed, stop here
-            if session.status == "failed":
-                return Response(
-                    {
-                        "answer": AnswerSerializer(ans).data,
-                        "session": GameSessionSerializer(session).data,
-                        "next": None,
-                    },
-                    status=201,
-                )
+
+            # save stage + session exactly once, after every transition
+            stage_run.save(update_fields=list(stage_run_fields))
+            session.save(update_fields=[
+                "total_score",
+                "wrong_count",
+                "pressure_level",
+                "status",
+                "ended_reason",
+                "ended_at",
+            ])
+
+        # If failed, stop here
+        if session.status == "failed":
+            return Response(
+                {
+                    "answer": serialize_answer(ans),
+                    "session": serialize_session(session),
+                    "next": None,
+                },
+                status=201,
+            )
 
         return Response(
             {
-                "answer": AnswerSerializer(ans).data,
-                "session": GameSessionSerializer(session).data,
+                "answer": serialize_answer(ans),
+                "session": serialize_session(session),
             },
             status=201,
         )
\ No newline at end of file
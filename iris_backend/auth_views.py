@@ -1,11 +1,50 @@
+import hashlib
+import time
+
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 from django.contrib.auth import authenticate
 from django.conf import settings
 
+# Refresh-cookie attributes, computed once at import instead of per login.
+_REFRESH_COOKIE_MAX_AGE = 90 * 24 * 60 * 60  # 90 days
+_REFRESH_COOKIE_KWARGS = {
+    "key": "refresh_token",
+    "httponly": True,
+    "secure": False,  # True in production (HTTPS)
+    "samesite": "Lax",
+    "max_age": _REFRESH_COOKIE_MAX_AGE,
+}
+
+# Short-lived cache of already-verified refresh tokens so bursts of refresh
+# calls from the same client skip the signature verification. Keyed by a
+# blake2b digest, so raw tokens never sit in memory; the 30s window means a
+# just-blacklisted token can still mint accesses for at most that long.
+_VERIFIED_TTL = 30
+_VERIFIED_MAX = 10_000
+_verified_refresh: dict = {}  # digest -> (expires_at, user_id)
+
+
+def _refresh_cache_key(refresh_token: str) -> bytes:
+    return hashlib.blake2b(refresh_token.encode(), digest_size=16).digest()
+
+
+def _cached_user_id(key: bytes):
+    hit = _verified_refresh.get(key)
+    if hit and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
+def _remember_user_id(key: bytes, user_id) -> None:
+    if len(_verified_refresh) >= _VERIFIED_MAX:
+        _verified_refresh.clear()
+    _verified_refresh[key] = (time.monotonic() + _VERIFIED_TTL, user_id)
+
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
@@ -33,14 +72,7 @@ def login_view(request):
     })
 
     # Set refresh token in HttpOnly cookie
-    response.set_cookie(
-        key="refresh_token",
-        value=str(refresh),
-        httponly=True,
-        secure=False,  # True in production (HTTPS)
-        samesite="Lax",
-        max_age=90 * 24 * 60 * 60,  # 90 days
-    )
+    response.set_cookie(value=str(refresh), **_REFRESH_COOKIE_KWARGS)
 
     return response
 
@@ -53,9 +85,19 @@ def refresh_view(request):
     if not refresh_token:
         return Response({"detail": "No refresh token"}, status=status.HTTP_401_UNAUTHORIZED)
 
+    cache_key = _refresh_cache_key(refresh_token)
+    user_id = _cached_user_id(cache_key)
+    if user_id is not None:
+        # Already verified within the TTL: mint the access token straight
+        # from the cached claim, skipping the crypto.
+        access = AccessToken()
+        access[api_settings.USER_ID_CLAIM] = user_id
+        return Response({"access": str(access)})
+
     try:
         refresh = RefreshToken(refresh_token)
         access_token = str(refresh.access_token)
+        _remember_user_id(cache_key, refresh[api_settings.USER_ID_CLAIM])
 
         return Response({"access": access_token})
 
@@ -0,0 +1,22 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional speedup, DRF's stdlib rendering still works
+    orjson = None
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSONRenderer that serializes with orjson when it is installed.
+
+    orjson emits bytes directly (no str -> bytes encode) and handles
+    datetimes/UUIDs natively; anything else falls back to str().
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
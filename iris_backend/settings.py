@@ -82,6 +82,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'iris_backend.wsgi.application'
+ASGI_APPLICATION = 'iris_backend.asgi.application'
 
 
 # Database
@@ -137,6 +138,9 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "iris_backend.renderers.OrjsonRenderer",
+    ),
 }
 
 from datetime import timedelta
@@ -3,3 +3,11 @@ from django.apps import AppConfig
 
 class ScenariosConfig(AppConfig):
     name = 'scenarios'
+
+    def ready(self):
+        # Build the topic allowlist once at startup and warm the parsed
+        # scenario cache, so no request pays the first-read cost. New
+        # scenario files need a refresh_topics() call (or a restart).
+        from . import views
+        for topic in views.refresh_topics():
+            views._load_scenario_file(topic)
@@ -1,34 +1,68 @@
 import os
-import json
 from django.conf import settings
-from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
-from rest_framework.decorators import api_view, permission_classes
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
 
+from gameplay.providers import parse_scenario_bytes
 
-DATA_FOLDER = os.path.join(settings.BASE_DIR, "scenarios", "data")
 
+DATA_FOLDER = os.path.join(settings.BASE_DIR, "scenarios", "data")
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def topics(request):
-    files = [
-        f.replace(".json", "")
-        for f in os.listdir(DATA_FOLDER)
-        if f.endswith(".json")
-    ]
-    return Response({"topics": files})
+# topic -> (mtime_ns, parsed dict); same mtime-keyed caching as the
+# gameplay loaders, so repeated detail requests skip disk and parse.
+_SCENARIO_CACHE: dict = {}
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def scenario_detail(request, topic):
+def _load_scenario_file(topic: str):
     file_path = os.path.join(DATA_FOLDER, f"{topic}.json")
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = _SCENARIO_CACHE.get(topic)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(file_path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+    data = parse_scenario_bytes(raw)
+    _SCENARIO_CACHE[topic] = (mtime, data)
+    return data
+
+
+# Topic allowlist, built once at startup (ScenariosConfig.ready) so the
+# topics endpoint answers from memory instead of scanning the directory
+# per request.
+_TOPICS: tuple = ()
+
+
+def refresh_topics() -> tuple:
+    """Rebuilds the cached topic list with a single directory scan."""
+    global _TOPICS
+    try:
+        with os.scandir(DATA_FOLDER) as entries:
+            _TOPICS = tuple(
+                sorted(e.name[:-5] for e in entries if e.name.endswith(".json"))
+            )
+    except FileNotFoundError:
+        _TOPICS = ()
+    return _TOPICS
+
+
+@require_GET
+async def topics(request):
+    # Async plain Django view: unauthenticated and memory-backed, so
+    # under ASGI it never occupies a worker thread.
+    return JsonResponse({"topics": list(_TOPICS)})
+
 
-    if not os.path.exists(file_path):
-        return Response({"error": "Scenario not found"}, status=404)
+@require_GET
+async def scenario_detail(request, topic):
+    # Scenarios are warmed into _SCENARIO_CACHE at startup; the only
+    # syscall left per request is the freshness stat, cheap enough to
+    # stay on the event loop.
+    data = _load_scenario_file(topic)
 
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    if data is None:
+        return JsonResponse({"error": "Scenario not found"}, status=404)
 
-    return Response(data)
\ No newline at end of file
+    return JsonResponse(data)
\ No newline at end of file